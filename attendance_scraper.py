@@ -1195,16 +1195,17 @@ class AttendanceScraper:
         attendance_data = []
 
         # Debug: Print all tables found
-        logger.debug(f"Found {len(tables)} tables on the page")
-        for i, table in enumerate(tables):
-            rows = table.find_all('tr')
-            logger.debug(f"Table {i+1} has {len(rows)} rows")
-            if rows:
-                # Print the first row to see what it contains
-                first_row = rows[0]
-                cells = first_row.find_all(['th', 'td'])
-                cell_texts = [cell.text.strip() for cell in cells]
-                logger.debug(f"First row of Table {i+1}: {cell_texts}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Found {len(tables)} tables on the page")
+            for i, table in enumerate(tables):
+                rows = table.find_all('tr')
+                logger.debug(f"Table {i+1} has {len(rows)} rows")
+                if rows:
+                    # Print the first row to see what it contains
+                    first_row = rows[0]
+                    cells = first_row.find_all(['th', 'td'])
+                    cell_texts = [cell.text.strip() for cell in cells]
+                    logger.debug(f"First row of Table {i+1}: {cell_texts}")
 
         # First approach: Look for rows with tdRollNo class (from old project)
         roll_no_cells = soup.find_all('td', {'class': 'tdRollNo'})
@@ -1621,7 +1622,7 @@ class AttendanceScraper:
                         # Simple comparison - if data is the same, don't update
                         if existing_data == data:
                             should_update = False
-                        else:
+                        elif logger.isEnabledFor(logging.DEBUG):
                             # Log what changed
                             changes = []
                             for key in set(data.keys()) | set(existing_data.keys()):
@@ -5,39 +5,100 @@ Chrome configuration module for setting up Chrome and ChromeDriver paths.
 import os
 import sys
 import logging
+import functools
+import json
 import shutil
+import stat
 import subprocess
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-)
+# Logging is configured by the importing application (or in __main__ below);
+# configuring it here would pre-empt the importer's own basicConfig handlers
 logger = logging.getLogger("chrome_config")
 
+# Standard install locations, filtered to the current platform at import time
+# so lookups never stat paths that cannot exist on this OS
+_CHROME_PATHS: Tuple[str, ...] = {
+    "linux": (
+        "/usr/bin/google-chrome",  # Docker standard location
+        "/usr/bin/google-chrome-stable",
+        "/usr/bin/chromium-browser",
+        "/usr/bin/chromium",
+        "/opt/google/chrome/chrome",
+        "/opt/render/chrome/chrome",
+    ),
+}.get(sys.platform, ())
+
+_CHROMEDRIVER_PATHS: Tuple[str, ...] = {
+    "linux": (
+        "/usr/bin/chromedriver",  # Docker standard location
+    ),
+}.get(sys.platform, ())
+
+def _is_executable(path: str) -> bool:
+    """
+    Check that a path is an executable regular file using a single stat call.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        bool: True if the path is an executable file, False otherwise
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
+
+def _which(names: Tuple[str, ...], search_path: Optional[str]) -> Optional[str]:
+    """
+    Return the first of the given executables found on PATH.
+
+    Args:
+        names: Executable names in order of preference
+        search_path: Value of the PATH environment variable
+
+    Returns:
+        str or None: Full path of the first executable found, None otherwise
+    """
+    for name in names:
+        found = shutil.which(name, path=search_path)
+        if found:
+            return found
+    return None
+
 def get_chrome_path() -> Optional[str]:
     """
     Get the path to the Chrome binary.
 
+    The lookup is cached per (CHROME_PATH, PATH) pair, so repeated calls only
+    touch the filesystem again when the environment changes.
+
     Returns:
         str or None: Path to Chrome binary if found, None otherwise
     """
+    return _resolve_chrome_path(os.environ.get("CHROME_PATH"), os.environ.get("PATH"))
+
+@functools.lru_cache(maxsize=None)
+def _resolve_chrome_path(chrome_path: Optional[str], search_path: Optional[str]) -> Optional[str]:
+    """Resolve the Chrome binary for the given environment values."""
     # Check environment variable first (set in Dockerfile)
-    chrome_path = os.environ.get("CHROME_PATH")
-    if chrome_path and os.path.exists(chrome_path):
+    if chrome_path and _is_executable(chrome_path):
         logger.info(f"Using Chrome path from environment variable: {chrome_path}")
         return chrome_path
 
-    # Docker standard location
-    docker_chrome_path = "/usr/bin/google-chrome"
-    if os.path.exists(docker_chrome_path):
-        logger.info(f"Found Chrome at Docker standard location: {docker_chrome_path}")
-        return docker_chrome_path
+    # Standard locations for this platform
+    standard_path = next(filter(_is_executable, _CHROME_PATHS), None)
+    if standard_path:
+        logger.info(f"Found Chrome at standard location: {standard_path}")
+        return standard_path
 
     # Check if Chrome is in PATH
-    chrome_in_path = shutil.which("google-chrome") or shutil.which("chromium-browser") or shutil.which("chrome")
+    chrome_in_path = _which(("google-chrome", "chromium-browser", "chrome"), search_path)
     if chrome_in_path:
         logger.info(f"Found Chrome in PATH: {chrome_in_path}")
         return chrome_in_path
@@ -49,23 +110,30 @@ def get_chromedriver_path() -> Optional[str]:
     """
     Get the path to the ChromeDriver binary.
 
+    The lookup is cached per (CHROMEDRIVER_PATH, PATH) pair, so repeated calls
+    only touch the filesystem again when the environment changes.
+
     Returns:
         str or None: Path to ChromeDriver binary if found, None otherwise
     """
+    return _resolve_chromedriver_path(os.environ.get("CHROMEDRIVER_PATH"), os.environ.get("PATH"))
+
+@functools.lru_cache(maxsize=None)
+def _resolve_chromedriver_path(chromedriver_path: Optional[str], search_path: Optional[str]) -> Optional[str]:
+    """Resolve the ChromeDriver binary for the given environment values."""
     # Check environment variable first (set in Dockerfile)
-    chromedriver_path = os.environ.get("CHROMEDRIVER_PATH")
-    if chromedriver_path and os.path.exists(chromedriver_path):
+    if chromedriver_path and _is_executable(chromedriver_path):
         logger.info(f"Using ChromeDriver path from environment variable: {chromedriver_path}")
         return chromedriver_path
 
-    # Docker standard location
-    docker_chromedriver_path = "/usr/bin/chromedriver"
-    if os.path.exists(docker_chromedriver_path):
-        logger.info(f"Found ChromeDriver at Docker standard location: {docker_chromedriver_path}")
-        return docker_chromedriver_path
+    # Standard locations for this platform
+    standard_path = next(filter(_is_executable, _CHROMEDRIVER_PATHS), None)
+    if standard_path:
+        logger.info(f"Found ChromeDriver at standard location: {standard_path}")
+        return standard_path
 
     # Check if ChromeDriver is in PATH
-    chromedriver_in_path = shutil.which("chromedriver")
+    chromedriver_in_path = _which(("chromedriver",), search_path)
     if chromedriver_in_path:
         logger.info(f"Found ChromeDriver in PATH: {chromedriver_in_path}")
         return chromedriver_in_path
@@ -73,13 +141,118 @@ def get_chromedriver_path() -> Optional[str]:
     logger.warning("ChromeDriver binary not found")
     return None
 
+def clear_cache() -> None:
+    """
+    Forget cached Chrome and ChromeDriver lookups.
+
+    Call this after installing or moving binaries at runtime.
+    """
+    _resolve_chrome_path.cache_clear()
+    _resolve_chromedriver_path.cache_clear()
+    _build_chrome_config.cache_clear()
+
+# Version strings keyed by binary path and mtime, shared across processes so
+# workers and restarts skip re-running --version on an unchanged binary
+VERSION_CACHE_FILE = Path(tempfile.gettempdir()) / ".chrome_version_cache.json"
+_version_cache_lock = threading.Lock()
+
+def _read_version_cache() -> Dict[str, Any]:
+    """Load the version cache file, returning an empty cache if it is unusable."""
+    try:
+        with open(VERSION_CACHE_FILE, "r") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _store_cached_version(binary_path: str, mtime: float, version: str) -> None:
+    """Record a probed version in the cache file."""
+    with _version_cache_lock:
+        cache = _read_version_cache()
+        cache[binary_path] = {"mtime": mtime, "version": version}
+        tmp_path = None
+        try:
+            # mkstemp creates the file exclusively with a random name, so a file or
+            # symlink planted in the shared temp dir cannot redirect the write
+            fd, tmp_path = tempfile.mkstemp(prefix=f"{VERSION_CACHE_FILE.name}.", suffix=".tmp",
+                                            dir=VERSION_CACHE_FILE.parent)
+            with os.fdopen(fd, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, VERSION_CACHE_FILE)
+        except OSError as e:
+            logger.warning(f"Could not write version cache {VERSION_CACHE_FILE}: {e}")
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+def _get_version(label: str, binary_path: str) -> Optional[str]:
+    """
+    Run a binary with --version and return its output.
+
+    Results are cached on disk and reused while the binary's mtime is unchanged.
+
+    Args:
+        label: Human-readable name of the binary, used in log messages
+        binary_path: Path to the binary
+
+    Returns:
+        str or None: The version string if the probe succeeded, None otherwise
+    """
+    try:
+        mtime = os.stat(binary_path).st_mtime
+    except OSError as e:
+        logger.error(f"Error getting {label} version: {e}")
+        return None
+
+    cached = _read_version_cache().get(binary_path)
+    if isinstance(cached, dict) and cached.get("mtime") == mtime:
+        return cached.get("version")
+
+    try:
+        # Version strings are plain ASCII, so capture bytes and decode them directly
+        # instead of going through locale-aware text mode; LC_ALL=C also spares
+        # Chrome from loading locale data just to print its version
+        result = subprocess.run(
+            [binary_path, "--version"],
+            capture_output=True,
+            timeout=5,
+            env=dict(os.environ, LC_ALL="C"),
+        )
+        if result.returncode == 0:
+            version = result.stdout.decode("ascii", "replace").strip()
+            _store_cached_version(binary_path, mtime, version)
+            return version
+    except Exception as e:
+        logger.error(f"Error getting {label} version: {e}")
+    return None
+
 def get_chrome_config() -> Dict[str, Any]:
     """
     Get Chrome configuration.
 
+    The result is computed once per process; use refresh_chrome_config() to
+    recompute it after the binaries change.
+
     Returns:
         dict: Chrome configuration
     """
+    return dict(_build_chrome_config())
+
+def refresh_chrome_config() -> Dict[str, Any]:
+    """
+    Drop all cached lookups and recompute the Chrome configuration.
+
+    Returns:
+        dict: Chrome configuration
+    """
+    clear_cache()
+    return get_chrome_config()
+
+@functools.lru_cache(maxsize=1)
+def _build_chrome_config() -> Dict[str, Any]:
+    """Resolve the binaries and probe their versions."""
     chrome_path = get_chrome_path()
     chromedriver_path = get_chromedriver_path()
 
@@ -90,28 +263,34 @@ def get_chrome_config() -> Dict[str, Any]:
         "chromedriver_found": chromedriver_path is not None
     }
 
-    # Try to get Chrome version
-    if chrome_path:
-        try:
-            result = subprocess.run([chrome_path, "--version"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                config["chrome_version"] = result.stdout.strip()
-        except Exception as e:
-            logger.error(f"Error getting Chrome version: {e}")
-
-    # Try to get ChromeDriver version
-    if chromedriver_path:
-        try:
-            result = subprocess.run([chromedriver_path, "--version"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                config["chromedriver_version"] = result.stdout.strip()
-        except Exception as e:
-            logger.error(f"Error getting ChromeDriver version: {e}")
+    # Probe both binaries at once; each --version call is dominated by process startup
+    probes = {
+        "chrome_version": ("Chrome", chrome_path),
+        "chromedriver_version": ("ChromeDriver", chromedriver_path),
+    }
+    probes = {key: probe for key, probe in probes.items() if probe[1]}
+    if probes:
+        # Imported here: path-only callers (scraper_wrapper, selenium_login_utils) never probe
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = {
+                key: executor.submit(_get_version, label, path)
+                for key, (label, path) in probes.items()
+            }
+            for key, future in futures.items():
+                version = future.result()
+                if version is not None:
+                    config[key] = version
 
     return config
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    )
+
     # Print Chrome configuration
     config = get_chrome_config()
-    import json
     print(json.dumps(config, indent=2))
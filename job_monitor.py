@@ -11,14 +11,20 @@ from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 # Import job storage module
-from job_storage import load_job, save_job, list_jobs
+from job_storage import load_job, save_job, list_job_summaries
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-)
-logger = logging.getLogger("job_monitor")
+# Import custom logging configuration if available
+try:
+    from logging_config import get_logger
+    # Get a logger with extra context
+    logger = get_logger("job_monitor", {"component": "job_monitor"})
+except ImportError:
+    # Fall back to basic logging configuration
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    )
+    logger = logging.getLogger("job_monitor")
 
 # Maximum job runtime in seconds (15 minutes)
 MAX_JOB_RUNTIME = 15 * 60
@@ -32,21 +38,25 @@ def check_for_stalled_jobs() -> List[str]:
     """
     logger.info("Checking for stalled jobs")
     
-    # Get all jobs
-    jobs = list_jobs()
+    # Get the status and start time of all jobs; full job data is only loaded for stalled jobs
+    jobs = list_job_summaries()
     stalled_jobs = []
     
     # Current time
     now = datetime.now()
     
-    for job_id, job_data in jobs.items():
+    # ISO-8601 timestamps sort chronologically, so jobs can be screened with a
+    # string comparison and only the (rare) candidates need parsing
+    cutoff_str = (now - timedelta(seconds=MAX_JOB_RUNTIME)).isoformat()
+    
+    for job_id, job_summary in jobs.items():
         # Skip jobs that are not in running state
-        if job_data.get("status") != "running":
+        if job_summary.get("status") != "running":
             continue
         
         # Check if the job has a start time
-        start_time_str = job_data.get("start_time")
-        if not start_time_str:
+        start_time_str = job_summary.get("start_time")
+        if not start_time_str or start_time_str >= cutoff_str:
             continue
         
         try:
@@ -60,6 +70,10 @@ def check_for_stalled_jobs() -> List[str]:
             if runtime.total_seconds() > MAX_JOB_RUNTIME:
                 logger.warning(f"Job {job_id} has been running for {runtime.total_seconds()} seconds, marking as stalled")
                 
+                job_data = load_job(job_id)
+                if not job_data:
+                    continue
+                
                 # Mark the job as failed
                 job_data["status"] = "failed"
                 job_data["message"] = f"Job timed out after {int(runtime.total_seconds())} seconds"
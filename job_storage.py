@@ -3,14 +3,17 @@ Job storage module for persisting job status between server restarts.
 """
 
 import os
+import copy
+import asyncio
 import json
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
 # Import custom logging configuration if available
 try:
-    from logging_config import configure_logging, get_logger
+    from logging_config import get_logger
     # Get a logger with extra context
     logger = get_logger("job_storage", {"component": "job_storage"})
 except ImportError:
@@ -21,19 +24,51 @@ except ImportError:
     )
     logger = logging.getLogger("job_storage")
 
+# Use orjson for job files when it is installed; fall back to the standard library
+try:
+    import orjson
+
+    def _dumps(job_data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(job_data, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(job_data: Dict[str, Any]) -> bytes:
+        return json.dumps(job_data, indent=2).encode("utf-8")
+
+    _loads = json.loads
+
 # Define the storage directory
 STORAGE_DIR = Path("job_storage")
 
+# Status and start time of each job file from the last list_job_summaries() scan,
+# keyed by job ID. Each entry holds the file's (inode, mtime_ns, size) so unchanged
+# files are not re-read; only these two fields are kept, not the full job data.
+_summary_cache: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+
+# Set once the storage directory is known to exist, so later calls skip the filesystem check
+_storage_dir_ready = False
+
 def ensure_storage_dir():
     """Ensure the storage directory exists"""
-    if not STORAGE_DIR.exists():
+    global _storage_dir_ready
+    if _storage_dir_ready:
+        return
+
+    try:
         STORAGE_DIR.mkdir(parents=True)
         logger.info(f"Created job storage directory: {STORAGE_DIR}")
+    except FileExistsError:
+        pass
+    _storage_dir_ready = True
 
 def save_job(job_id: str, job_data: Dict[str, Any]) -> bool:
     """
     Save job data to a file
 
+    The data is written to a temporary file and renamed into place, so readers
+    never see a truncated job file.
+
     Args:
         job_id: The job ID
         job_data: The job data to save
@@ -43,16 +78,102 @@ def save_job(job_id: str, job_data: Dict[str, Any]) -> bool:
     """
     ensure_storage_dir()
 
+    file_path = STORAGE_DIR / f"{job_id}.json"
+    # Unique per writer so concurrent saves of the same job don't share a temp file
+    tmp_path = STORAGE_DIR / f"{job_id}.json.{os.getpid()}.{threading.get_ident()}.tmp"
     try:
-        file_path = STORAGE_DIR / f"{job_id}.json"
-        with open(file_path, 'w') as f:
-            json.dump(job_data, f, indent=2)
-        logger.info(f"Saved job {job_id} to {file_path}")
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(job_data))
+        os.replace(tmp_path, file_path)
+        logger.debug("Saved job %s to %s", job_id, file_path)
         return True
     except Exception as e:
         logger.error(f"Error saving job {job_id}: {str(e)}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
         return False
 
+class JobPersister:
+    """
+    Coalesces job saves and funnels them through a single writer: jobs are
+    marked dirty as they change, and run() writes each dirty job at most once
+    per flush interval from a worker thread, one batch at a time. flush_now()
+    wakes the writer straight away for terminal states.
+
+    Only used from the event loop thread, so no locking is needed.
+    """
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        # Dirty jobs by job ID; the job dict itself is kept so jobs evicted from
+        # the caller's cache are still written
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+        # Set while run() is active, to wake it before the interval is up
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def mark_dirty(self, job_id: str, job_data: Dict[str, Any]) -> None:
+        """
+        Schedule a job to be written on the next flush
+
+        Args:
+            job_id: The job ID
+            job_data: The job data
+        """
+        self._dirty[job_id] = job_data
+
+    def flush_now(self, job_id: str, job_data: Dict[str, Any]) -> None:
+        """
+        Write a job as soon as possible: the writer is woken up if it is
+        running, otherwise the job is saved right here
+
+        Args:
+            job_id: The job ID
+            job_data: The job data
+        """
+        if self._wakeup is None:
+            self._dirty.pop(job_id, None)
+            save_job(job_id, job_data)
+            return
+        self._dirty[job_id] = job_data
+        self._wakeup.set()
+
+    def flush(self) -> None:
+        """Write every dirty job once"""
+        dirty, self._dirty = self._dirty, {}
+        for job_id, job_data in dirty.items():
+            save_job(job_id, job_data)
+
+    @staticmethod
+    def _write_batch(batch: Dict[str, Dict[str, Any]]) -> None:
+        for job_id, job_data in batch.items():
+            save_job(job_id, job_data)
+
+    async def run(self) -> None:
+        """Write dirty jobs every interval (or when woken) until cancelled"""
+        self._wakeup = asyncio.Event()
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                if not self._dirty:
+                    continue
+                # Snapshot on the event loop thread; the jobs keep changing while the batch is written
+                batch, self._dirty = copy.deepcopy(self._dirty), {}
+                write = asyncio.ensure_future(asyncio.to_thread(self._write_batch, batch))
+                try:
+                    await asyncio.shield(write)
+                except asyncio.CancelledError:
+                    # Finish the batch before stopping, so it cannot land after
+                    # (and overwrite) newer data written by flush()
+                    await write
+                    raise
+        finally:
+            self._wakeup = None
+
 def load_job(job_id: str) -> Optional[Dict[str, Any]]:
     """
     Load job data from a file
@@ -71,14 +192,42 @@ def load_job(job_id: str) -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        with open(file_path, 'r') as f:
-            job_data = json.load(f)
-        logger.info(f"Loaded job {job_id} from {file_path}")
+        job_data = _loads(file_path.read_bytes())
+        logger.debug("Loaded job %s from %s", job_id, file_path)
         return job_data
     except Exception as e:
         logger.error(f"Error loading job {job_id}: {str(e)}")
         return None
 
+def _job_files():
+    """
+    Yield the job files in the storage directory.
+
+    Yields:
+        Tuple of (job_id, file path, (inode, mtime_ns, size))
+    """
+    ensure_storage_dir()
+
+    with os.scandir(STORAGE_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                # File disappeared between the directory read and the stat
+                continue
+            yield entry.name[:-len(".json")], entry.path, (entry.inode(), st.st_mtime_ns, st.st_size)
+
+def _read_job_file(job_id: str, path: str) -> Optional[Dict[str, Any]]:
+    """Parse a job file, logging and returning None if it can't be read"""
+    try:
+        with open(path, 'rb') as f:
+            return _loads(f.read())
+    except Exception as e:
+        logger.error(f"Error loading job {job_id}: {str(e)}")
+        return None
+
 def list_jobs() -> Dict[str, Dict[str, Any]]:
     """
     List all saved jobs
@@ -86,18 +235,46 @@ def list_jobs() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dict: A dictionary of job_id -> job_data
     """
-    ensure_storage_dir()
-
     jobs = {}
-    for file_path in STORAGE_DIR.glob("*.json"):
-        job_id = file_path.stem
-        job_data = load_job(job_id)
+    for job_id, path, _ in _job_files():
+        job_data = _read_job_file(job_id, path)
         if job_data:
             jobs[job_id] = job_data
-
     logger.info(f"Listed {len(jobs)} jobs")
     return jobs
 
+def list_job_summaries() -> Dict[str, Dict[str, Any]]:
+    """
+    List the status and start time of all saved jobs
+
+    Only files that changed since the previous call are re-read.
+
+    Returns:
+        Dict: A dictionary of job_id -> {"status", "start_time"}
+    """
+    summaries = {}
+    seen = set()
+    for job_id, path, signature in _job_files():
+        cached = _summary_cache.get(job_id)
+        if cached is None or cached[0] != signature:
+            job_data = _read_job_file(job_id, path)
+            if job_data is None:
+                _summary_cache.pop(job_id, None)
+                continue
+            summary = {"status": job_data.get("status"), "start_time": job_data.get("start_time")} if job_data else {}
+            cached = (signature, summary)
+            _summary_cache[job_id] = cached
+
+        seen.add(job_id)
+        if cached[1]:
+            summaries[job_id] = dict(cached[1])
+
+    # Forget jobs whose files were deleted or became unreadable
+    for job_id in _summary_cache.keys() - seen:
+        del _summary_cache[job_id]
+
+    return summaries
+
 def delete_job(job_id: str) -> bool:
     """
     Delete a job file
@@ -117,7 +294,7 @@ def delete_job(job_id: str) -> bool:
 
     try:
         file_path.unlink()
-        logger.info(f"Deleted job {job_id} from {file_path}")
+        logger.debug("Deleted job %s from %s", job_id, file_path)
         return True
     except Exception as e:
         logger.error(f"Error deleting job {job_id}: {str(e)}")
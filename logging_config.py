@@ -7,12 +7,35 @@ It includes custom formatters, handlers, and filters to make logs more focused a
 
 import os
 import sys
+import queue
+import atexit
+import gzip
 import json
+import time
+import shutil
 import logging
-from datetime import datetime
+import logging.handlers
+from collections import deque
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+# Use orjson for JSON logs when it is installed; fall back to the standard library
+try:
+    import orjson
+
+    def _json_dumps(data: Dict[str, Any]) -> str:
+        return orjson.dumps(data).decode("utf-8")
+
+    _json_dumps_bytes = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+
+    def _json_dumps_bytes(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+    _json_loads = json.loads
+
 # Create logs directory if it doesn't exist
 LOGS_DIR = Path("logs")
 LOGS_DIR.mkdir(exist_ok=True)
@@ -23,21 +46,39 @@ ERROR_LOG_FILE = LOGS_DIR / "error.log"
 SUPABASE_LOG_FILE = LOGS_DIR / "supabase.log"
 DEBUG_LOG_FILE = LOGS_DIR / "debug.log"
 
-# Maximum log file size (10 MB)
-MAX_LOG_SIZE = 10 * 1024 * 1024
+# Maximum log file size (50 MB)
+MAX_LOG_SIZE = 50 * 1024 * 1024
 
 # Maximum number of backup log files
 MAX_LOG_BACKUPS = 5
 
+# gzip level for rotated backups; 1 keeps the rollover cheap while still shrinking text logs several-fold
+LOG_BACKUP_COMPRESSLEVEL = 1
+
 # Define a custom JSON formatter for structured logging
 class JsonFormatter(logging.Formatter):
     """
     Custom formatter that outputs log records as JSON.
     This makes it easier to parse and analyze logs.
     """
-    def format(self, record):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, formatted local time) of the last record; one tuple so threads never see a mixed pair
+        self._second_cache = (None, "")
+
+    def _format_timestamp(self, record) -> str:
+        """Format the record time as a local ISO-8601 string with millisecond precision."""
+        second = int(record.created)
+        cached_second, prefix = self._second_cache
+        if cached_second != second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+            self._second_cache = (second, prefix)
+        return f"{prefix}.{int(record.msecs):03d}"
+
+    def _log_data(self, record) -> Dict[str, Any]:
         log_data = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self._format_timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -58,7 +99,14 @@ class JsonFormatter(logging.Formatter):
         if hasattr(record, "extra"):
             log_data.update(record.extra)
         
-        return json.dumps(log_data)
+        return log_data
+
+    def format(self, record):
+        return _json_dumps(self._log_data(record))
+
+    def format_bytes(self, record) -> bytes:
+        """Format the record as UTF-8 encoded JSON, skipping the intermediate str."""
+        return _json_dumps_bytes(self._log_data(record))
 
 # Define a custom filter for error logs
 class ErrorFilter(logging.Filter):
@@ -74,23 +122,161 @@ class SupabaseFilter(logging.Filter):
     Custom filter that only allows logs related to Supabase operations.
     """
     def filter(self, record):
-        return "supabase" in record.name.lower() or "supabase" in record.getMessage().lower()
+        if "supabase" in record.name.lower():
+            return True
+        # Check the raw message first; only records with %-style args need the
+        # (more expensive) formatted message
+        if "supabase" in str(record.msg).lower():
+            return True
+        return bool(record.args) and "supabase" in record.getMessage().lower()
+
+def _gzip_namer(name: str) -> str:
+    """Name rotated backups with a .gz suffix."""
+    return name + ".gz"
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    """Compress the log file being rotated into its backup and remove the original."""
+    # Move the file aside first, so the log name is free straight away and other
+    # processes sharing it see a new inode (FastRotatingFileHandler then reopens)
+    rotating = f"{source}.{os.getpid()}.rotating"
+    os.rename(source, rotating)
+    with open(rotating, "rb") as f_in, gzip.open(dest, "wb", compresslevel=LOG_BACKUP_COMPRESSLEVEL) as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(rotating)
+
+# Define a rotating file handler that tracks the file size itself
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that formats each record only once and takes the
+    file size from a single stat per record instead of seeking to the end.
+
+    The log files are shared by every gunicorn worker and by the scraper and
+    uploader subprocesses, so before each write the handler checks (like
+    WatchedFileHandler) whether another process rotated the file away and
+    reopens it if so; the stat also gives the size including their writes.
+
+    The file is opened in binary mode: JSON records are written as the bytes
+    orjson produces, other records are encoded to UTF-8 once. Rotated backups
+    are gzip-compressed (scraper.log.1.gz, scraper.log.2.gz, ...).
+    """
+    def __init__(self, *args, **kwargs):
+        # (st_dev, st_ino) of the open stream, set by _open()
+        self._file_id = None
+        self._size = 0
+        super().__init__(*args, **kwargs)
+        self.namer = _gzip_namer
+        self.rotator = _gzip_rotator
+        self._terminator_bytes = self.terminator.encode("utf-8")
+
+    def shouldRollover(self, record):
+        return self.maxBytes > 0 and self._size >= self.maxBytes
+
+    def doRollover(self):
+        super().doRollover()
+        self._size = 0
+
+    def _open(self):
+        stream = open(self.baseFilename, "ab")
+        st = os.fstat(stream.fileno())
+        self._file_id = (st.st_dev, st.st_ino)
+        self._size = st.st_size
+        return stream
+
+    def _check_rotated(self) -> None:
+        """Reopen the log file if it was rotated away, and refresh its size."""
+        try:
+            st = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            st = None
+
+        if self.stream is not None and (st is None or (st.st_dev, st.st_ino) != self._file_id):
+            self.stream.close()
+            self.stream = None
+        if self.stream is None:
+            self.stream = self._open()
+        elif st is not None:
+            self._size = st.st_size
+
+    def _encode(self, record) -> bytes:
+        if isinstance(self.formatter, JsonFormatter):
+            return self.formatter.format_bytes(record) + self._terminator_bytes
+        return (self.format(record) + self.terminator).encode("utf-8", "backslashreplace")
+
+    def emit(self, record):
+        try:
+            msg = self._encode(record)
+            self._check_rotated()
+            if self.maxBytes > 0 and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self.flush()
+            self._size += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+# Define a queue handler for records that never leave this process
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that hands records to the listener thread as they are.
+
+    The stock prepare() formats the record and drops exc_info so it can be
+    pickled; records here stay in-process, so only the message is resolved
+    up front (its args may change later) and exception info is kept for the
+    formatters on the listener thread.
+    """
+    def prepare(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+# Listener that writes queued records to the real handlers on a background thread
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+def _stop_queue_listener() -> None:
+    """Drain the log queue and close the handlers it was writing to."""
+    global _queue_listener
+    if _queue_listener is None:
+        return
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+    _queue_listener = None
+
+# Registered after logging's own exit hook, so it runs first and the queue is drained before shutdown
+atexit.register(_stop_queue_listener)
 
 # Configure the root logger
 def configure_logging(
     console_level: int = logging.INFO,
     file_level: int = logging.DEBUG,
-    enable_json: bool = False
+    enable_json: bool = False,
+    enable_debug_log: Optional[bool] = None,
+    verbose_init: bool = True
 ) -> None:
     """
     Configure the root logger with console and file handlers.
+
+    The root logger only gets a queue handler, so logging calls just enqueue
+    the record; a listener thread does the formatting and writing.
     
     Args:
         console_level: Logging level for the console handler
         file_level: Logging level for the file handler
         enable_json: Whether to use JSON formatting for logs
+        enable_debug_log: Whether to also write every record to debug.log, which
+            duplicates the main log; defaults to the ENABLE_DEBUG_LOG env var
+        verbose_init: Whether to log the resulting configuration
     """
-    # Clear any existing handlers
+    global _queue_listener
+    if enable_debug_log is None:
+        enable_debug_log = os.getenv("ENABLE_DEBUG_LOG", "0") == "1"
+
+    # Clear any existing handlers, writing out queued records before they are dropped
+    _stop_queue_listener()
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
@@ -106,74 +292,96 @@ def configure_logging(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
     
+    # Handlers fed by the queue listener
+    handlers: List[logging.Handler] = []
+
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(console_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
-    # Create main file handler (rotating file handler to manage log size)
-    try:
-        from logging.handlers import RotatingFileHandler
-        
-        # Main log file - contains all logs
-        main_file_handler = RotatingFileHandler(
-            MAIN_LOG_FILE,
-            maxBytes=MAX_LOG_SIZE,
-            backupCount=MAX_LOG_BACKUPS
-        )
-        main_file_handler.setLevel(file_level)
-        main_file_handler.setFormatter(formatter)
-        root_logger.addHandler(main_file_handler)
-        
-        # Error log file - contains only error and critical logs
-        error_file_handler = RotatingFileHandler(
-            ERROR_LOG_FILE,
-            maxBytes=MAX_LOG_SIZE,
-            backupCount=MAX_LOG_BACKUPS
-        )
-        error_file_handler.setLevel(logging.ERROR)
-        error_file_handler.setFormatter(formatter)
-        error_file_handler.addFilter(ErrorFilter())
-        root_logger.addHandler(error_file_handler)
-        
-        # Supabase log file - contains only Supabase-related logs
-        supabase_file_handler = RotatingFileHandler(
-            SUPABASE_LOG_FILE,
-            maxBytes=MAX_LOG_SIZE,
-            backupCount=MAX_LOG_BACKUPS
-        )
-        supabase_file_handler.setLevel(logging.DEBUG)
-        supabase_file_handler.setFormatter(formatter)
-        supabase_file_handler.addFilter(SupabaseFilter())
-        root_logger.addHandler(supabase_file_handler)
-        
-        # Debug log file - contains all debug logs
-        debug_file_handler = RotatingFileHandler(
+    # Create file handlers (rotating file handlers to manage log size)
+    # Main log file - contains all logs
+    main_file_handler = FastRotatingFileHandler(
+        MAIN_LOG_FILE,
+        maxBytes=MAX_LOG_SIZE,
+        backupCount=MAX_LOG_BACKUPS
+    )
+    main_file_handler.setLevel(file_level)
+    main_file_handler.setFormatter(formatter)
+    handlers.append(main_file_handler)
+    
+    # Error log file - contains only error and critical logs
+    error_file_handler = FastRotatingFileHandler(
+        ERROR_LOG_FILE,
+        maxBytes=MAX_LOG_SIZE,
+        backupCount=MAX_LOG_BACKUPS
+    )
+    # The handler level already restricts this file to error and critical logs
+    error_file_handler.setLevel(logging.ERROR)
+    error_file_handler.setFormatter(formatter)
+    handlers.append(error_file_handler)
+    
+    # Supabase log file - contains only Supabase-related logs
+    supabase_file_handler = FastRotatingFileHandler(
+        SUPABASE_LOG_FILE,
+        maxBytes=MAX_LOG_SIZE,
+        backupCount=MAX_LOG_BACKUPS
+    )
+    supabase_file_handler.setLevel(logging.DEBUG)
+    supabase_file_handler.setFormatter(formatter)
+    supabase_file_handler.addFilter(SupabaseFilter())
+    handlers.append(supabase_file_handler)
+    
+    # Debug log file - contains all debug logs (disabled by default)
+    if enable_debug_log:
+        debug_file_handler = FastRotatingFileHandler(
             DEBUG_LOG_FILE,
             maxBytes=MAX_LOG_SIZE,
             backupCount=MAX_LOG_BACKUPS
         )
         debug_file_handler.setLevel(logging.DEBUG)
         debug_file_handler.setFormatter(formatter)
-        root_logger.addHandler(debug_file_handler)
-        
-    except ImportError:
-        # Fall back to regular file handler if RotatingFileHandler is not available
-        file_handler = logging.FileHandler(MAIN_LOG_FILE)
-        file_handler.setLevel(file_level)
-        file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(debug_file_handler)
+    
+    # Route records through a queue so logging calls don't wait on console or file I/O
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    root_logger.addHandler(LocalQueueHandler(log_queue))
     
     # Log the configuration
-    logging.info(f"Logging configured with console_level={console_level}, file_level={file_level}, enable_json={enable_json}")
-    logging.info(f"Log files: main={MAIN_LOG_FILE}, error={ERROR_LOG_FILE}, supabase={SUPABASE_LOG_FILE}, debug={DEBUG_LOG_FILE}")
+    if verbose_init:
+        init_logger = logging.getLogger(__name__)
+        init_logger.info("Logging configured with console_level=%s, file_level=%s, enable_json=%s",
+                         console_level, file_level, enable_json)
+        init_logger.info("Log files: main=%s, error=%s, supabase=%s, debug=%s",
+                         MAIN_LOG_FILE, ERROR_LOG_FILE, SUPABASE_LOG_FILE,
+                         DEBUG_LOG_FILE if enable_debug_log else "disabled")
+
+# Define a custom filter that adds extra context to log records
+class ContextFilter(logging.Filter):
+    """
+    Custom filter that sets fixed extra attributes on every log record.
+    """
+    def __init__(self, extra: Dict[str, Any]):
+        super().__init__()
+        self.extra = dict(extra)
+
+    def filter(self, record):
+        for key, value in self.extra.items():
+            setattr(record, key, value)
+        return True
 
 # Helper function to get a logger with extra context
 def get_logger(name: str, extra: Optional[Dict[str, Any]] = None) -> logging.Logger:
     """
     Get a logger with extra context.
     
+    Calling this again with the same name and context reuses the existing
+    filter instead of stacking another one on the logger.
+    
     Args:
         name: Name of the logger
         extra: Extra context to add to all log records
@@ -184,18 +392,71 @@ def get_logger(name: str, extra: Optional[Dict[str, Any]] = None) -> logging.Log
     logger = logging.getLogger(name)
     
     if extra:
-        # Create a filter that adds extra context to all log records
-        class ContextFilter(logging.Filter):
-            def filter(self, record):
-                for key, value in extra.items():
-                    setattr(record, key, value)
-                return True
-        
-        # Add the filter to the logger
-        logger.addFilter(ContextFilter())
+        already_attached = any(
+            isinstance(existing, ContextFilter) and existing.extra == extra
+            for existing in logger.filters
+        )
+        if not already_attached:
+            # Add the filter to the logger
+            logger.addFilter(ContextFilter(extra))
     
     return logger
 
+# Block size used when reading log files backwards
+TAIL_BLOCK_SIZE = 8192
+
+def _tail_lines(path: Path, max_lines: int) -> List[str]:
+    """
+    Read the last lines of a file without loading the whole file.
+
+    The file is read backwards in blocks until enough newlines have been seen.
+
+    Args:
+        path: Path to the file
+        max_lines: Maximum number of lines to return
+
+    Returns:
+        List of the last max_lines lines, oldest first
+    """
+    if max_lines <= 0:
+        return []
+
+    if path.name.endswith(".gz"):
+        # Compressed backups can't be read backwards; stream through them instead
+        with gzip.open(path, "rb") as f:
+            return [line.rstrip(b"\r\n").decode("utf-8", "replace") for line in deque(f, maxlen=max_lines)]
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        # One extra newline guarantees the first returned line is complete
+        while position > 0 and data.count(b"\n") <= max_lines:
+            block_size = min(TAIL_BLOCK_SIZE, position)
+            position -= block_size
+            f.seek(position)
+            data = f.read(block_size) + data
+
+    return [line.decode("utf-8", "replace") for line in data.splitlines()[-max_lines:]]
+
+def _recent_log_lines(log_file: Path, max_lines: int) -> List[str]:
+    """
+    Read the last lines of a log file, continuing into its newest compressed
+    backup when the file was rotated recently and holds fewer lines.
+
+    Args:
+        log_file: Path to the current log file
+        max_lines: Maximum number of lines to return
+
+    Returns:
+        List of the last max_lines lines, oldest first
+    """
+    lines = _tail_lines(log_file, max_lines) if log_file.exists() else []
+    backup_file = Path(_gzip_namer(f"{log_file}.1"))
+    if len(lines) < max_lines and backup_file.exists():
+        lines = _tail_lines(backup_file, max_lines - len(lines)) + lines
+    return lines
+
 # Function to get recent error logs
 def get_recent_error_logs(max_lines: int = 100) -> List[Dict[str, Any]]:
     """
@@ -211,11 +472,8 @@ def get_recent_error_logs(max_lines: int = 100) -> List[Dict[str, Any]]:
         return []
     
     try:
-        with open(ERROR_LOG_FILE, "r") as f:
-            lines = f.readlines()
-        
         # Get the last max_lines lines
-        lines = lines[-max_lines:]
+        lines = _recent_log_lines(ERROR_LOG_FILE, max_lines)
         
         # Parse the lines as JSON if possible
         logs = []
@@ -223,7 +481,7 @@ def get_recent_error_logs(max_lines: int = 100) -> List[Dict[str, Any]]:
             try:
                 if line.strip():
                     # Try to parse as JSON first
-                    log_entry = json.loads(line)
+                    log_entry = _json_loads(line)
                     logs.append(log_entry)
                     continue
             except json.JSONDecodeError:
@@ -251,11 +509,8 @@ def get_recent_supabase_logs(max_lines: int = 100) -> List[Dict[str, Any]]:
         return []
     
     try:
-        with open(SUPABASE_LOG_FILE, "r") as f:
-            lines = f.readlines()
-        
         # Get the last max_lines lines
-        lines = lines[-max_lines:]
+        lines = _recent_log_lines(SUPABASE_LOG_FILE, max_lines)
         
         # Parse the lines as JSON if possible
         logs = []
@@ -263,7 +518,7 @@ def get_recent_supabase_logs(max_lines: int = 100) -> List[Dict[str, Any]]:
             try:
                 if line.strip():
                     # Try to parse as JSON first
-                    log_entry = json.loads(line)
+                    log_entry = _json_loads(line)
                     logs.append(log_entry)
                     continue
             except json.JSONDecodeError:
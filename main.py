@@ -1,14 +1,20 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from pydantic import BaseModel, validator
 import os
 import sys
+import asyncio
 import logging
 import re
+import hashlib
 from typing import Dict, Any, List, Optional
 import secrets
 import time
+import itertools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # In Docker, Chrome is pre-installed, so we don't need to set up Playwright browsers
@@ -16,7 +22,7 @@ from datetime import datetime
 print("Using pre-installed Chrome and ChromeDriver from Docker image")
 
 # Import job storage module
-from job_storage import save_job, load_job, list_jobs
+from job_storage import JobPersister, save_job, load_job, list_jobs
 
 # Import job monitor module
 from job_monitor import check_for_stalled_jobs
@@ -54,18 +60,24 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=[
         "https://nrenx.github.io",  # GitHub Pages domain
-        "http://localhost:3000",    # Local development
-        "*"                         # Allow all origins for testing
+        "http://localhost:3000"     # Local development
     ],
     allow_credentials=False,  # Changed to False since we're using Basic Auth
     allow_methods=["*"],      # Allow all methods
     allow_headers=["*"],      # Allow all headers
-    expose_headers=["*"]      # Expose all headers
+    expose_headers=["*"],     # Expose all headers
+    max_age=86400             # Let browsers cache preflight results for a day
 )
 
+# Compress larger responses (job status details carry the scrapers' output)
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Basic authentication
 security = HTTPBasic()
 
+# Academic year format, e.g. "2022-23" (\Z also rejects a trailing newline, unlike $)
+_ACADEMIC_YEAR_RE = re.compile(r'\A\d{4}-\d{2}\Z')
+
 # Define request models
 class ScrapeRequest(BaseModel):
     username: str
@@ -79,21 +91,21 @@ class ScrapeRequest(BaseModel):
 
     @validator('username')
     def username_must_not_be_default(cls, v):
-        if v == "string" or not v.strip():
+        if v == "string" or not v or v.isspace():
             raise ValueError('username must not be the default value "string" or empty')
         return v
 
     @validator('password')
     def password_must_not_be_default(cls, v):
-        if v == "string" or not v.strip():
+        if v == "string" or not v or v.isspace():
             raise ValueError('password must not be the default value "string" or empty')
         return v
 
     @validator('academic_year')
     def academic_year_must_be_valid(cls, v):
-        if v == "string" or not v.strip():
+        if v == "string" or not v or v.isspace():
             raise ValueError('academic_year must not be the default value "string" or empty')
-        if not re.match(r'^\d{4}-\d{2}$', v):
+        if not _ACADEMIC_YEAR_RE.match(v):
             raise ValueError('academic_year must be in the format "YYYY-YY" (e.g., "2022-23")')
         return v
 
@@ -110,27 +122,220 @@ class JobStatusResponse(BaseModel):
     progress: Optional[float] = None
     details: Optional[Dict[str, Any]] = None
 
+# Maximum number of jobs kept in memory; older jobs are still served from storage
+MAX_JOBS_IN_MEMORY = 10000
+
+# Seconds a finished job stays in memory after it was last used (it is still served from storage)
+JOB_CACHE_TTL = 60 * 60
+
+# Job states after which a job no longer changes
+FINISHED_JOB_STATUSES = ("completed", "failed")
+
+class JobStatusCache:
+    """
+    In-memory job status store that evicts the least recently used jobs
+    once it holds more than maxsize entries, and drops finished jobs that
+    have not been used for ttl seconds when purge_expired() is called.
+
+    Wraps an OrderedDict instead of subclassing it, so only the operations
+    below are exposed and the LRU order changes only through them.
+
+    Only accessed from the event loop thread, so no locking is needed.
+    """
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Job status dicts by job ID, least recently used first
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # time.monotonic() of the last read or write of each job
+        self._last_used: Dict[str, float] = {}
+
+    def get(self, job_id: str, default: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Return a job's status dict and mark it as recently used"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return default
+        self._jobs.move_to_end(job_id)
+        self._last_used[job_id] = time.monotonic()
+        return job
+
+    def __setitem__(self, job_id: str, job: Dict[str, Any]) -> None:
+        self._jobs[job_id] = job
+        self._jobs.move_to_end(job_id)
+        self._last_used[job_id] = time.monotonic()
+        while len(self._jobs) > self.maxsize:
+            evicted_id, _ = self._jobs.popitem(last=False)
+            self._last_used.pop(evicted_id, None)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._jobs
+
+    def keys(self):
+        return self._jobs.keys()
+
+    def purge_expired(self) -> int:
+        """
+        Drop finished jobs that have not been used for ttl seconds.
+
+        Running and queued jobs are kept: their task updates the cached dict in
+        place, so a copy reloaded from storage would go stale.
+
+        Returns:
+            int: The number of jobs dropped
+        """
+        cutoff = time.monotonic() - self.ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.get("status") in FINISHED_JOB_STATUSES and self._last_used.get(job_id, 0) < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+            self._last_used.pop(job_id, None)
+        return len(expired)
+
 # Store job status
-job_status = {}
+job_status = JobStatusCache(MAX_JOBS_IN_MEMORY, JOB_CACHE_TTL)
+
+# (second, ISO string) for the current second; replaced as a whole so readers never see a torn pair
+_iso_now_cache = (0, "")
+
+def iso_now() -> str:
+    """
+    Get the current local time as an ISO 8601 string at one-second resolution.
+
+    The string is only rebuilt when the second changes, so bursts of requests
+    share one datetime and string allocation.
+
+    Returns:
+        str: The current time, e.g. "2024-01-31T12:34:56"
+    """
+    global _iso_now_cache
+    now = int(time.time())
+    cached_second, cached_iso = _iso_now_cache
+    if cached_second != now:
+        cached_iso = datetime.fromtimestamp(now).isoformat()
+        _iso_now_cache = (now, cached_iso)
+    return cached_iso
+
+# Job IDs are a random per-process prefix plus a counter, so no clock read or
+# random bytes are needed per job
+_JOB_ID_PREFIX = secrets.token_hex(4)
+_job_counter = itertools.count()
+
+# Coalesces job status writes; terminal states are still written immediately
+job_persister = JobPersister()
+
+# Seconds between background checks for stalled jobs
+STALL_CHECK_INTERVAL = 30
+
+# Seconds between purges of expired finished jobs from memory
+JOB_CACHE_PURGE_INTERVAL = 5 * 60
+
+# Result of the most recent stalled job check
+last_stalled_scan: Dict[str, Any] = {"time": None, "stalled_jobs": []}
+
+# Background tasks started with the app (references keep them from being garbage collected)
+_background_tasks: List[asyncio.Task] = []
+
+def _load_saved_jobs() -> Dict[str, Dict[str, Any]]:
+    """
+    Read recently finished jobs from storage. Jobs that finished longer ago
+    than the cache TTL are loaded on demand by get_job_status; unfinished jobs
+    belong to other workers (or to a process that died) and keep changing, so
+    get_job_status reads those from storage on every request.
+
+    Returns:
+        Dict mapping job IDs to job data
+    """
+    finished_cutoff = datetime.fromtimestamp(time.time() - JOB_CACHE_TTL).isoformat()
+    return {
+        job_id: job for job_id, job in list_jobs().items()
+        if job.get("status") in FINISHED_JOB_STATUSES and (job.get("end_time") or "") >= finished_cutoff
+    }
+
+async def _preload_saved_jobs():
+    """Load saved jobs into memory in the background so startup is not held up by the scan"""
+    try:
+        saved_jobs = await asyncio.to_thread(_load_saved_jobs)
+    except Exception as e:
+        logger.error(f"Error loading saved jobs: {str(e)}")
+        return
 
-# Load any saved jobs from storage
-try:
-    saved_jobs = list_jobs()
     if saved_jobs:
         logger.info(f"Loaded {len(saved_jobs)} saved jobs from storage")
-        job_status.update(saved_jobs)
-except Exception as e:
-    logger.error(f"Error loading saved jobs: {str(e)}")
+        # Jobs created or loaded since startup are newer than their saved copies
+        for job_id, job in saved_jobs.items():
+            if job_id not in job_status:
+                job_status[job_id] = job
+
+async def _stall_sweeper():
+    """
+    Periodically mark jobs that have been running for too long as failed.
+
+    The check runs in a worker thread since it reads job files; jobs that are
+    also held in memory are then updated in place so status requests (and the
+    job itself, if it is still going) see the failure.
+    """
+    while True:
+        await asyncio.sleep(STALL_CHECK_INTERVAL)
+        try:
+            stalled_jobs = await asyncio.to_thread(check_for_stalled_jobs)
+        except Exception as e:
+            logger.error(f"Error checking for stalled jobs: {str(e)}")
+            continue
+
+        last_stalled_scan["time"] = iso_now()
+        last_stalled_scan["stalled_jobs"] = stalled_jobs
+        if not stalled_jobs:
+            continue
+
+        logger.info(f"Found and marked {len(stalled_jobs)} stalled jobs")
+        for job_id in stalled_jobs:
+            job = job_status.get(job_id)
+            stored_job = load_job(job_id)
+            if job is not None and stored_job:
+                for key in ("status", "message", "end_time"):
+                    job[key] = stored_job.get(key)
+
+async def _job_cache_purger():
+    """Periodically drop finished jobs that have not been used for JOB_CACHE_TTL"""
+    while True:
+        await asyncio.sleep(JOB_CACHE_PURGE_INTERVAL)
+        purged = job_status.purge_expired()
+        if purged:
+            logger.info(f"Dropped {purged} expired jobs from memory")
+
+@app.on_event("startup")
+async def start_background_tasks():
+    """Start the job writer, saved job preload, stalled job sweeper and cache purger"""
+    for coro in (job_persister.run(), _preload_saved_jobs(), _stall_sweeper(), _job_cache_purger()):
+        _background_tasks.append(asyncio.create_task(coro))
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    """Stop the background tasks and write any jobs still pending"""
+    for task in _background_tasks:
+        task.cancel()
+    # Wait for the tasks to wind down (the job writer finishes its current batch)
+    await asyncio.gather(*_background_tasks, return_exceptions=True)
+    _background_tasks.clear()
+    job_persister.flush()
+
+def _credentials_digest(username: str, password: str) -> bytes:
+    """Hash a username/password pair into a fixed-size digest for comparison"""
+    return hashlib.sha256(f"{username}:{password}".encode("utf-8")).digest()
+
+# Expected credentials, resolved once at startup
+_EXPECTED_CREDENTIALS_DIGEST = _credentials_digest(
+    os.getenv("API_USERNAME", "admin"),
+    os.getenv("API_PASSWORD", "password")
+)
 
 def get_current_username(credentials: HTTPBasicCredentials = Depends(security)):
     """Validate API credentials"""
-    correct_username = os.getenv("API_USERNAME", "admin")
-    correct_password = os.getenv("API_PASSWORD", "password")
-
-    is_correct_username = secrets.compare_digest(credentials.username, correct_username)
-    is_correct_password = secrets.compare_digest(credentials.password, correct_password)
+    provided_digest = _credentials_digest(credentials.username, credentials.password)
 
-    if not (is_correct_username and is_correct_password):
+    if not secrets.compare_digest(provided_digest, _EXPECTED_CREDENTIALS_DIGEST):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -148,7 +353,7 @@ def read_root():
 def health_check():
     """Health check endpoint for Render"""
     logger.info("Health check endpoint accessed")
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {"status": "healthy", "timestamp": iso_now()}
 
 @app.options("/cors-test")
 def cors_test_preflight():
@@ -163,7 +368,7 @@ def cors_test():
     return {
         "status": "success",
         "message": "CORS is working correctly",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": iso_now()
     }
 
 # Debug endpoint removed to streamline application
@@ -186,6 +391,37 @@ def cors_test():
 
 # Debug endpoint removed to streamline application
 
+def _initial_job_state(
+    username: str,
+    academic_year: str,
+    scrape_attendance: bool,
+    scrape_mid_marks: bool,
+    scrape_personal_details: bool,
+    upload_to_supabase: bool,
+    force_update: bool
+) -> Dict[str, Any]:
+    """
+    Build the status dict of a newly queued job
+
+    Returns:
+        Dict: The job status
+    """
+    return {
+        "status": "queued",
+        "message": "Job queued for processing",
+        "start_time": iso_now(),
+        "progress": 0.0,
+        "details": {
+            "username": username,
+            "academic_year": academic_year,
+            "scrape_attendance": scrape_attendance,
+            "scrape_mid_marks": scrape_mid_marks,
+            "scrape_personal_details": scrape_personal_details,
+            "upload_to_supabase": upload_to_supabase,
+            "force_update": force_update
+        }
+    }
+
 @app.post("/scrape", response_model=ScrapeResponse)
 async def scrape_data(
     request: ScrapeRequest,
@@ -201,28 +437,24 @@ async def scrape_data(
                 f"scrape_personal_details={request.scrape_personal_details}, upload_to_supabase={request.upload_to_supabase}")
 
     # Generate a unique job ID
-    job_id = f"job_{int(time.time())}_{secrets.token_hex(4)}"
+    job_id = f"job_{_JOB_ID_PREFIX}_{next(_job_counter):08x}"
     logger.info(f"Generated job ID: {job_id}")
 
     # Initialize job status
-    job_status[job_id] = {
-        "status": "queued",
-        "message": "Job queued for processing",
-        "start_time": datetime.now().isoformat(),
-        "progress": 0.0,
-        "details": {
-            "username": request.username,
-            "academic_year": request.academic_year,
-            "scrape_attendance": request.scrape_attendance,
-            "scrape_mid_marks": request.scrape_mid_marks,
-            "scrape_personal_details": request.scrape_personal_details,
-            "upload_to_supabase": request.upload_to_supabase,
-            "force_update": request.force_update
-        }
-    }
+    job = _initial_job_state(
+        request.username,
+        request.academic_year,
+        request.scrape_attendance,
+        request.scrape_mid_marks,
+        request.scrape_personal_details,
+        request.upload_to_supabase,
+        request.force_update
+    )
+    job_status[job_id] = job
 
-    # Save job to persistent storage
-    save_job(job_id, job_status[job_id])
+    # Save job to persistent storage before returning its ID, so any worker can
+    # serve a status request for it straight away
+    save_job(job_id, job)
 
     # Add job to background tasks
     background_tasks.add_task(
@@ -253,24 +485,19 @@ async def get_job_status(job_id: str, username: str = Depends(get_current_userna
     """
     logger.info(f"Job status endpoint accessed for job_id={job_id} by {username}")
 
-    # Check for stalled jobs before returning status
-    # This ensures we don't keep showing "running" for jobs that have stalled
-    try:
-        stalled_jobs = check_for_stalled_jobs()
-        if stalled_jobs:
-            logger.info(f"Found and marked {len(stalled_jobs)} stalled jobs")
-    except Exception as e:
-        logger.error(f"Error checking for stalled jobs: {str(e)}")
-
-    # Check if job is in memory
-    if job_id not in job_status:
+    # Check if job is in memory (jobs run by this process, and finished jobs)
+    job = job_status.get(job_id)
+    if job is None:
         # Try to load from persistent storage
         logger.info(f"Job {job_id} not found in memory, trying to load from storage")
         stored_job = load_job(job_id)
 
         if stored_job:
-            # Add to in-memory cache
-            job_status[job_id] = stored_job
+            job = stored_job
+            # Another worker may still be updating an unfinished job, so only
+            # finished jobs are added to the in-memory cache
+            if job.get("status") in FINISHED_JOB_STATUSES:
+                job_status[job_id] = job
             logger.info(f"Loaded job {job_id} from storage")
         else:
             logger.warning(f"Job {job_id} not found in storage")
@@ -279,8 +506,36 @@ async def get_job_status(job_id: str, username: str = Depends(get_current_userna
             logger.info(f"Available job IDs in memory: {available_jobs}")
             raise HTTPException(status_code=404, detail="Job not found")
 
-    logger.info(f"Returning status for job {job_id}: {job_status[job_id]['status']}")
-    return job_status[job_id]
+    logger.info(f"Returning status for job {job_id}: {job['status']}")
+    return job
+
+# Scrapers run by a job: (scraper type, status description, label for errors)
+SCRAPER_STEPS = (
+    ("attendance", "attendance data", "Attendance"),
+    ("mid_marks", "mid marks data", "Mid marks"),
+    ("personal_details", "personal details", "Personal details"),
+)
+
+# Maximum number of scrapers running at the same time in this process, across
+# all jobs (each one drives its own browser). Every gunicorn worker has its own
+# budget, so the default keeps one browser per worker as before; raise it only
+# on instances with memory to spare
+SCRAPER_CONCURRENCY = max(1, int(os.getenv("SCRAPER_CONCURRENCY", "1")))
+
+# Dedicated threads for the blocking scraper calls, so scrapers neither exceed
+# the concurrency budget nor tie up the default executor used for other I/O
+_scraper_executor = ThreadPoolExecutor(max_workers=SCRAPER_CONCURRENCY, thread_name_prefix="scraper")
+
+# Indicators that a scraper failed because the portal rejected the credentials
+_AUTH_FAILURE_STDERR_RE = re.compile(r'Login failed|Authentication failed|Invalid credentials|exit status 1')
+_AUTH_FAILURE_STDOUT_RE = re.compile(r'Login failed|Authentication failed')
+
+def _is_auth_failure(result: Dict[str, Any]) -> bool:
+    """Check a failed scraper result for authentication failure indicators"""
+    return bool(
+        _AUTH_FAILURE_STDERR_RE.search(result.get("stderr", "") or "")
+        or _AUTH_FAILURE_STDOUT_RE.search(result.get("stdout", "") or "")
+    )
 
 async def process_scrape_job(
     job_id: str,
@@ -296,159 +551,135 @@ async def process_scrape_job(
     """
     Process a scraping job in the background
     """
-    # Initialize job status if it doesn't exist (in case of worker restart)
-    if job_id not in job_status:
-        job_status[job_id] = {
-            "status": "queued",
-            "message": "Job queued for processing",
-            "start_time": datetime.now().isoformat(),
-            "progress": 0.0,
-            "details": {
-                "username": username,
-                "academic_year": academic_year,
-                "scrape_attendance": scrape_attendance,
-                "scrape_mid_marks": scrape_mid_marks,
-                "scrape_personal_details": scrape_personal_details,
-                "upload_to_supabase": upload_to_supabase,
-                "force_update": force_update
-            }
-        }
-    try:
-        # Update job status
-        job_status[job_id]["status"] = "running"
-        job_status[job_id]["message"] = "Scraping in progress"
-
-        # Save updated status to storage
-        save_job(job_id, job_status[job_id])
+    # Keep a direct reference to the job's status dict; the job keeps updating it
+    # (and saving it) even if the in-memory cache evicts the entry meanwhile.
+    # scrape_data has normally created it already; rebuild it if it was evicted.
+    job = job_status.get(job_id)
+    if job is None:
+        job = _initial_job_state(
+            username,
+            academic_year,
+            scrape_attendance,
+            scrape_mid_marks,
+            scrape_personal_details,
+            upload_to_supabase,
+            force_update
+        )
+        job_status[job_id] = job
+
+    loop = asyncio.get_running_loop()
+
+    def mark_running(message: str, progress: float) -> None:
+        """Switch the job from queued to running and save it"""
+        if job["status"] != "queued":
+            return
+        job["status"] = "running"
+        job["message"] = message
+        job["progress"] = progress
+        # The stall check times jobs from start_time, so restart it here: time
+        # spent waiting for a scraper thread does not count as running
+        job["start_time"] = iso_now()
+        job_persister.mark_dirty(job_id, job)
 
-        # Run scrapers
+    try:
+        # Run the enabled scrapers on the scraper threads; each one is a blocking
+        # subprocess call, so this keeps the event loop free
+        enabled_scrapers = {
+            "attendance": scrape_attendance,
+            "mid_marks": scrape_mid_marks,
+            "personal_details": scrape_personal_details,
+        }
+        steps = [step for step in SCRAPER_STEPS if enabled_scrapers[step[0]]]
         scrape_results = {}
 
-        if scrape_attendance:
-            job_status[job_id]["message"] = "Scraping attendance data"
-            job_status[job_id]["progress"] = 0.1
-            attendance_result = run_scraper(
-                "attendance",
-                username,
-                password,
-                academic_year,
-                workers=1,  # Reduced to 1 worker to minimize resource usage on Render
-                worker_mode="thread"
-            )
-            scrape_results["attendance"] = attendance_result
-            job_status[job_id]["progress"] = 0.3
-
-            # Check if scraper failed due to authentication error or any other error
-            if not attendance_result["success"]:
-                error_message = attendance_result.get("stderr", "") or ""
-                stdout_message = attendance_result.get("stdout", "") or ""
-
-                # Check for various authentication failure indicators
-                if ("Login failed" in error_message or "Authentication failed" in error_message or
-                    "Invalid credentials" in error_message or "Login failed" in stdout_message or
-                    "Authentication failed" in stdout_message or "exit status 1" in error_message):
-                    job_status[job_id]["status"] = "failed"
-                    job_status[job_id]["message"] = "Authentication failed: Invalid username or password"
-                    job_status[job_id]["details"]["results"] = scrape_results
-                    job_status[job_id]["end_time"] = datetime.now().isoformat()
-                    return
-
-                # Stop processing if any scraper fails
-                job_status[job_id]["status"] = "failed"
-                job_status[job_id]["message"] = "Attendance scraper failed. Please check credentials and try again."
-                job_status[job_id]["details"]["results"] = scrape_results
-                job_status[job_id]["end_time"] = datetime.now().isoformat()
-                return
-
-        if scrape_mid_marks:
-            job_status[job_id]["message"] = "Scraping mid marks data"
-            mid_marks_result = run_scraper(
-                "mid_marks",
-                username,
-                password,
-                academic_year,
-                workers=1,  # Reduced to 1 worker to minimize resource usage on Render
-                worker_mode="thread"
-            )
-            scrape_results["mid_marks"] = mid_marks_result
-            job_status[job_id]["progress"] = 0.5
-
-            # Check if scraper failed due to authentication error or any other error
-            if not mid_marks_result["success"]:
-                error_message = mid_marks_result.get("stderr", "") or ""
-                stdout_message = mid_marks_result.get("stdout", "") or ""
-
-                # Check for various authentication failure indicators
-                if ("Login failed" in error_message or "Authentication failed" in error_message or
-                    "Invalid credentials" in error_message or "Login failed" in stdout_message or
-                    "Authentication failed" in stdout_message or "exit status 1" in error_message):
-                    job_status[job_id]["status"] = "failed"
-                    job_status[job_id]["message"] = "Authentication failed: Invalid username or password"
-                    job_status[job_id]["details"]["results"] = scrape_results
-                    job_status[job_id]["end_time"] = datetime.now().isoformat()
-                    return
-
-                # Stop processing if any scraper fails
-                job_status[job_id]["status"] = "failed"
-                job_status[job_id]["message"] = "Mid marks scraper failed. Please check credentials and try again."
-                job_status[job_id]["details"]["results"] = scrape_results
-                job_status[job_id]["end_time"] = datetime.now().isoformat()
-                return
-
-        if scrape_personal_details:
-            job_status[job_id]["message"] = "Scraping personal details"
-            personal_details_result = run_scraper(
-                "personal_details",
-                username,
-                password,
-                academic_year,
-                workers=1,  # Reduced to 1 worker to minimize resource usage on Render
-                worker_mode="thread"
-            )
-            scrape_results["personal_details"] = personal_details_result
-            job_status[job_id]["progress"] = 0.7
-
-            # Check if scraper failed due to authentication error or any other error
-            if not personal_details_result["success"]:
-                error_message = personal_details_result.get("stderr", "") or ""
-                stdout_message = personal_details_result.get("stdout", "") or ""
-
-                # Check for various authentication failure indicators
-                if ("Login failed" in error_message or "Authentication failed" in error_message or
-                    "Invalid credentials" in error_message or "Login failed" in stdout_message or
-                    "Authentication failed" in stdout_message or "exit status 1" in error_message):
-                    job_status[job_id]["status"] = "failed"
-                    job_status[job_id]["message"] = "Authentication failed: Invalid username or password"
-                    job_status[job_id]["details"]["results"] = scrape_results
-                    job_status[job_id]["end_time"] = datetime.now().isoformat()
+        if steps:
+            scraping_message = "Scraping " + ", ".join(description for _, description, _ in steps)
+            completed = 0
+
+            def call_scraper(scraper_type: str) -> Dict[str, Any]:
+                # Runs on a scraper thread: the job stays queued until one of
+                # its scrapers actually gets a thread
+                loop.call_soon_threadsafe(mark_running, scraping_message, 0.1)
+                return run_scraper(
+                    scraper_type,
+                    username,
+                    password,
+                    academic_year,
+                    workers=1,  # Reduced to 1 worker to minimize resource usage on Render
+                    worker_mode="thread"
+                )
+
+            async def run_step(scraper_type: str) -> Dict[str, Any]:
+                nonlocal completed
+                result = await loop.run_in_executor(_scraper_executor, call_scraper, scraper_type)
+                completed += 1
+                job["progress"] = 0.1 + 0.6 * completed / len(steps)
+                job_persister.mark_dirty(job_id, job)
+                return result
+
+            async def run_steps(batch) -> None:
+                results = await asyncio.gather(
+                    *(run_step(scraper_type) for scraper_type, _, _ in batch),
+                    return_exceptions=True
+                )
+                for (scraper_type, _, _), result in zip(batch, results):
+                    if isinstance(result, BaseException):
+                        raise result
+                    scrape_results[scraper_type] = result
+
+            if SCRAPER_CONCURRENCY == 1:
+                # Scrapers would only run one at a time anyway: run them in order
+                # and stop at the first failure, which fails the job
+                for step in steps:
+                    await run_steps([step])
+                    if not scrape_results[step[0]]["success"]:
+                        break
+            else:
+                # The first scraper runs alone, so a job that is going to fail
+                # (e.g. wrong credentials) stops after a single login attempt;
+                # the others then run concurrently
+                await run_steps(steps[:1])
+                if scrape_results[steps[0][0]]["success"]:
+                    await run_steps(steps[1:])
+
+            # Fail the job on the first failed scraper, in the usual scraper order
+            for scraper_type, _, label in steps:
+                result = scrape_results.get(scraper_type)
+                if result is not None and not result["success"]:
+                    job["status"] = "failed"
+                    if _is_auth_failure(result):
+                        job["message"] = "Authentication failed: Invalid username or password"
+                    else:
+                        job["message"] = f"{label} scraper failed. Please check credentials and try again."
+                    job["details"]["results"] = scrape_results
+                    job["end_time"] = iso_now()
+
+                    # Save failed status to storage
+                    job_persister.flush_now(job_id, job)
                     return
-
-                # Stop processing if any scraper fails
-                job_status[job_id]["status"] = "failed"
-                job_status[job_id]["message"] = "Personal details scraper failed. Please check credentials and try again."
-                job_status[job_id]["details"]["results"] = scrape_results
-                job_status[job_id]["end_time"] = datetime.now().isoformat()
-                return
+        else:
+            mark_running("Scraping in progress", 0.0)
 
         # Upload to Supabase if requested and at least one scraper was successful
         if upload_to_supabase and any(result.get("success", False) for result in scrape_results.values()):
-            job_status[job_id]["message"] = "Uploading data to Supabase"
-            upload_result = run_uploader(force_update=force_update)
+            job["message"] = "Uploading data to Supabase"
+            # The upload is a blocking subprocess call too; keep it off the event loop
+            upload_result = await asyncio.to_thread(run_uploader, force_update=force_update)
             scrape_results["upload"] = upload_result
-            job_status[job_id]["progress"] = 0.9
+            job["progress"] = 0.9
         elif upload_to_supabase:
             # Skip upload if all scrapers failed
-            job_status[job_id]["message"] = "Skipping upload as all scrapers failed"
+            job["message"] = "Skipping upload as all scrapers failed"
             scrape_results["upload"] = {
                 "success": False,
                 "message": "Upload skipped because all scrapers failed"
             }
-            job_status[job_id]["progress"] = 0.9
+            job["progress"] = 0.9
 
         # Update job status based on scraper results
-        job_status[job_id]["progress"] = 1.0
-        job_status[job_id]["details"]["results"] = scrape_results
-        job_status[job_id]["end_time"] = datetime.now().isoformat()
+        job["progress"] = 1.0
+        job["details"]["results"] = scrape_results
+        job["end_time"] = iso_now()
 
         # Check for authentication failures
         auth_failure = False
@@ -459,27 +690,27 @@ async def process_scrape_job(
 
         if auth_failure:
             # Special handling for authentication failures
-            job_status[job_id]["status"] = "failed"
-            job_status[job_id]["message"] = "Authentication failed. Please check your credentials."
+            job["status"] = "failed"
+            job["message"] = "Authentication failed. Please check your credentials."
             logger.warning(f"Job {job_id} failed due to authentication error")
         # Check if any scraper was successful
         elif any(result.get("success", False) for result in scrape_results.values()):
-            job_status[job_id]["status"] = "completed"
+            job["status"] = "completed"
 
             # Count successful and failed scrapers
             successful_scrapers = sum(1 for result in scrape_results.values() if result.get("success", False))
             total_scrapers = len(scrape_results)
 
             if successful_scrapers == total_scrapers:
-                job_status[job_id]["message"] = "All scraping tasks completed successfully"
+                job["message"] = "All scraping tasks completed successfully"
             else:
-                job_status[job_id]["message"] = f"{successful_scrapers} of {total_scrapers} scraping tasks completed successfully"
+                job["message"] = f"{successful_scrapers} of {total_scrapers} scraping tasks completed successfully"
         else:
-            job_status[job_id]["status"] = "failed"
-            job_status[job_id]["message"] = "All scraping tasks failed"
+            job["status"] = "failed"
+            job["message"] = "All scraping tasks failed"
 
         # Save final job status to storage
-        save_job(job_id, job_status[job_id])
+        job_persister.flush_now(job_id, job)
 
     except Exception as e:
         import traceback
@@ -490,13 +721,25 @@ async def process_scrape_job(
         tb = traceback.format_exc()
         logger.error(f"Traceback:\n{tb}")
 
-        job_status[job_id]["status"] = "failed"
-        job_status[job_id]["message"] = f"Error: {str(e)}"
-        job_status[job_id]["end_time"] = datetime.now().isoformat()
+        job["status"] = "failed"
+        job["message"] = f"Error: {str(e)}"
+        job["end_time"] = iso_now()
 
         # Save error status to storage
-        save_job(job_id, job_status[job_id])
+        job_persister.flush_now(job_id, job)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # "auto" picks uvloop and httptools when they are installed (uvicorn[standard]).
+    # Workers default to 1: each one runs its own scrapers and browsers.
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    # Multiple workers need an import string so each one can load the app; a
+    # single worker serves this app object instead of importing main a second time
+    uvicorn.run(
+        "main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        workers=workers,
+        loop="auto",
+        http="auto"
+    )
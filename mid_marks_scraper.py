@@ -1796,16 +1796,17 @@ class MidMarksScraper:
         attendance_data = []
 
         # Debug: Print all tables found
-        logger.debug(f"Found {len(tables)} tables on the page")
-        for i, table in enumerate(tables):
-            rows = table.find_all('tr')
-            logger.debug(f"Table {i+1} has {len(rows)} rows")
-            if rows:
-                # Print the first row to see what it contains
-                first_row = rows[0]
-                cells = first_row.find_all(['th', 'td'])
-                cell_texts = [cell.text.strip() for cell in cells]
-                logger.debug(f"First row of Table {i+1}: {cell_texts}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Found {len(tables)} tables on the page")
+            for i, table in enumerate(tables):
+                rows = table.find_all('tr')
+                logger.debug(f"Table {i+1} has {len(rows)} rows")
+                if rows:
+                    # Print the first row to see what it contains
+                    first_row = rows[0]
+                    cells = first_row.find_all(['th', 'td'])
+                    cell_texts = [cell.text.strip() for cell in cells]
+                    logger.debug(f"First row of Table {i+1}: {cell_texts}")
 
         # First approach: Look for rows with tdRollNo class (from old project)
         roll_no_cells = soup.find_all('td', {'class': 'tdRollNo'})
@@ -2221,7 +2222,7 @@ class MidMarksScraper:
                         # Compare both subjects and labs
                         if existing_data.get('subjects') == subjects and existing_data.get('labs', {}) == labs:
                             should_update = False
-                        else:
+                        elif logger.isEnabledFor(logging.DEBUG):
                             # Log what changed in subjects
                             changes = []
                             existing_subjects = existing_data.get('subjects', {})
@@ -1286,7 +1286,7 @@ class PersonalDetailsScraper:
                         # Simple comparison - if data is the same, don't update
                         if existing_data == personal_details_data['data']:
                             should_update = False
-                        else:
+                        elif logger.isEnabledFor(logging.DEBUG):
                             # Log what changed
                             changes = []
                             for key in set(personal_details_data['data'].keys()) | set(existing_data.keys()):
@@ -4,7 +4,6 @@ Selenium-based login utilities for the college website scraper.
 This module handles authentication to the college portal using Selenium.
 """
 
-import os
 import sys
 import time
 import logging
@@ -25,6 +24,9 @@ import undetected_chromedriver as uc
 # Import configuration
 from config import USERNAME, PASSWORD, ATTENDANCE_PORTAL_URL, MID_MARKS_PORTAL_URL, DEFAULT_SETTINGS
 
+# Import Chrome configuration
+from chrome_config import get_chrome_path
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -75,22 +77,8 @@ def create_driver(headless: bool = True) -> webdriver.Chrome:
         # Set user data directory
         options.add_argument(f"--user-data-dir={user_data_dir}")
 
-        # Try to find Chrome binary
-        chrome_paths = [
-            "/usr/bin/google-chrome-stable",
-            "/usr/bin/google-chrome",
-            "/usr/bin/chromium-browser",
-            "/usr/bin/chromium",
-            "/opt/google/chrome/chrome",
-            "/opt/render/chrome/chrome"
-        ]
-
-        chrome_path = None
-        for path in chrome_paths:
-            if os.path.exists(path):
-                chrome_path = path
-                logger.info(f"Found Chrome binary at: {chrome_path}")
-                break
+        # Try to find Chrome binary (shared, cached resolver)
+        chrome_path = get_chrome_path()
 
         if chrome_path:
             logger.info(f"Setting Chrome binary location to: {chrome_path}")